@@ -1,10 +1,22 @@
 import streamlit as st
 st.caption("Build: 2025-08-09-02")
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
+from diskcache import Cache
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import plotly.graph_objects as go
+import numpy as np
+import asyncio
+from collections import Counter
+from itertools import chain
+import hashlib
+import io
 import json
 import os
+import shutil
+import threading
+import uuid
 from datetime import datetime
 
 # -------------------------------
@@ -14,13 +26,59 @@ st.set_page_config(layout="wide")
 
 # Load secrets
 OPENAI_API_KEY = st.secrets["OPENAI_API_KEY"]
-client = OpenAI(api_key=OPENAI_API_KEY)
+
+@st.cache_resource
+def get_openai_client() -> OpenAI:
+    """Process-wide client, so its HTTP connection pool survives reruns."""
+    return OpenAI(api_key=OPENAI_API_KEY)
+
+# Chat models and output caps; latency is dominated by generated tokens.
+# ORG_MODEL lets the org-wide synthesis use a stronger model than the rest.
+MODEL = st.secrets.get("OPENAI_MODEL", "gpt-4o-mini")
+ORG_MODEL = st.secrets.get("OPENAI_ORG_MODEL", MODEL)
+TEMPERATURE = 0.4
+MAX_TOKENS = 700
+DEPT_MAX_TOKENS = 600
+ORG_MAX_TOKENS = 800
+
+# Max in-flight requests when fanning out insights, to stay under TPM limits
+MAX_CONCURRENT_REQUESTS = 5
+# Retries per fan-out request; the SDK backs off and honours Retry-After on 429s
+FANOUT_MAX_RETRIES = 5
+
+# Identical prompts reuse a stored completion for this long (seconds)
+LLM_CACHE_TTL = 24 * 60 * 60
 
 # -------------------------------
 # Data & Utilities
 # -------------------------------
-with open("mizan_values_pool.json", "r") as f:
-    MIZAN_VALUES_POOL = json.load(f)
+@st.cache_resource
+def _load_pool() -> list:
+    with open("mizan_values_pool.json", "r") as f:
+        return json.load(f)
+
+@st.cache_resource
+def _pool_indexes() -> tuple:
+    """Lookup tables derived from the pool, built once per process (not per rerun)."""
+    pool = _load_pool()
+    # parallel arrays indexed by pool position, so aggregation runs in numpy
+    names = np.array([v["name"] for v in pool])
+    levels = np.array([v["level"] for v in pool], dtype=np.int8)
+    neg = np.array([v["type"] == "negative" for v in pool])
+    # Responses store each value's "id", which stays fixed when the pool is
+    # edited; id -> position (-1 for ids no longer in the pool) is resolved here.
+    ids = [v["id"] for v in pool]
+    if len(set(ids)) != len(ids):
+        raise ValueError("mizan_values_pool.json has duplicate ids")
+    id_to_pos = np.full(max(ids) + 1, -1, dtype=np.intp)
+    id_to_pos[ids] = np.arange(len(pool))
+    # multiselect labels, and label -> value id. Labels, not names, pick
+    # the entry: "Exclusion" is in the pool at both level 2 and level 6.
+    value_options = [f"{v['name']}: {v['definition']}" for v in pool]
+    option_to_id = {opt: v["id"] for opt, v in zip(value_options, pool)}
+    return names, levels, neg, id_to_pos, value_options, option_to_id
+
+NAMES, LEVELS, NEG, ID_TO_POS, VALUE_OPTIONS, OPTION_TO_ID = _pool_indexes()
 
 MIZAN_LEVELS = {
     1: "Survival & Security",
@@ -32,47 +90,357 @@ MIZAN_LEVELS = {
     7: "Legacy & Sustainability",
 }
 
+INSIGHT_LOG = "logs/insights.jsonl"
+
 def log_ai_insight(content: str, context: str = "general"):
-    os.makedirs("logs", exist_ok=True)
-    ts = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    path = f"logs/{context}_{ts}.txt"
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
+    """Append one insight as a JSON line to INSIGHT_LOG."""
+    line = json.dumps({"ts": datetime.now().isoformat(), "ctx": context, "content": content})
+    # module globals reset on every rerun, so create the directory only when the append fails
+    try:
+        f = open(INSIGHT_LOG, "a", encoding="utf-8")
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(INSIGHT_LOG), exist_ok=True)
+        f = open(INSIGHT_LOG, "a", encoding="utf-8")
+    with f:
+        f.write(line + "\n")
+
+@st.cache_resource
+def _llm_cache() -> Cache:
+    return Cache(".llm_cache")
+
+def _llm_cache_key(model: str, max_tokens: int, prompt: str) -> str:
+    return hashlib.sha256(f"{model}\n{max_tokens}\n{prompt}".encode("utf-8")).hexdigest()
+
+def stream_chat(prompt: str, model: str = MODEL, max_tokens: int = MAX_TOKENS) -> str:
+    """Render the completion for prompt as tokens arrive and return its text.
+
+    Served from the disk cache when the same request was made recently.
+    """
+    cache = _llm_cache()
+    key = _llm_cache_key(model, max_tokens, prompt)
+    hit = cache.get(key)
+    if hit is not None:
+        st.markdown(hit)
+        return hit
+    stream = get_openai_client().chat.completions.create(
+        model=model,
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=max_tokens,
+        temperature=TEMPERATURE,
+        stream=True,
+    )
+    text = st.write_stream(
+        chunk.choices[0].delta.content or "" for chunk in stream if chunk.choices
+    ).strip()
+    cache.set(key, text, expire=LLM_CACHE_TTL)
+    return text
+
+@st.cache_resource
+def _logo() -> bytes:
+    with open("logo.png", "rb") as f:
+        return f.read()
+
+# the _struct_hash gate already skips re-parsing within a session; keep only a few uploads
+@st.cache_data(max_entries=4)
+def _parse_structure(data: bytes) -> pd.DataFrame:
+    return pd.read_csv(io.BytesIO(data))
 
 def get_company() -> dict:
     """Return company dict from session_state or {}."""
     return st.session_state.get("company_info", {}) or {}
 
-def get_employee_df_for_company(company_name: str) -> pd.DataFrame:
-    """Return df of valid employee responses for a company."""
-    rows = [
-        e for e in st.session_state.get("employee_responses", [])
-        if isinstance(e, dict)
-        and e.get("company") == company_name
-        and all(k in e for k in ("department", "current_experience", "desired_values", "personal_values"))
-    ]
-    return pd.DataFrame(rows) if rows else pd.DataFrame()
+VALUE_COLUMNS = ("current_experience", "desired_values", "personal_values")
+RESPONSE_COLUMNS = ("department",) + VALUE_COLUMNS
+
+RESPONSES_DIR = "data/responses"
+
+# Every part file is written with this schema, so a one-row file can't pin a
+# column to whatever type that row's value happened to infer (e.g. a NaN department)
+RESPONSE_SCHEMA = pa.schema([
+    ("response_id", pa.string()),
+    ("name", pa.string()),
+    ("email", pa.string()),
+    ("department", pa.string()),
+    ("personal_values", pa.list_(pa.int16())),
+    ("current_experience", pa.list_(pa.int16())),
+    ("desired_values", pa.list_(pa.int16())),
+    ("engagement", pa.int8()),
+    ("recognition", pa.int8()),
+    ("company", pa.string()),
+])
+
+def _company_dir(company_name: str) -> str:
+    """One directory of response files per company; the name is hashed to keep paths safe."""
+    return os.path.join(RESPONSES_DIR, hashlib.md5(company_name.encode("utf-8")).hexdigest())
+
+def _part_files(path: str) -> list:
+    """Finished response files in a company directory (dot-prefixed temp files excluded)."""
+    try:
+        return sorted(n for n in os.listdir(path) if n.endswith(".parquet") and not n.startswith("."))
+    except FileNotFoundError:
+        return []
+
+def _responses_rev(company_name: str) -> tuple:
+    """(mtime_ns, file count) of the company's directory; (0, 0) when it has no responses.
+
+    The count catches two writes inside one coarse mtime tick.
+    """
+    path = _company_dir(company_name)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return (0, 0)
+    return (mtime, len(_part_files(path)))
+
+def add_employee_response(entry: dict):
+    """Persist one submitted response as its own parquet file.
+
+    Parquet has no append mode, so each submission is a new file in the
+    company's directory. Entries are checked here, so readers can rely on
+    the columns.
+    """
+    missing = [c for c in ("company",) + RESPONSE_COLUMNS if c not in entry]
+    if missing:
+        raise ValueError(f"Response is missing {', '.join(missing)}")
+    if not isinstance(entry["department"], str) or not entry["department"]:
+        raise ValueError(f"Response department must be a non-empty string, got {entry['department']!r}")
+    path = _company_dir(entry["company"])
+    os.makedirs(path, exist_ok=True)
+    response_id = uuid.uuid4().hex
+    name = f"{datetime.now():%Y%m%d-%H%M%S}-{response_id}.parquet"
+    _write_part(pd.DataFrame([{**entry, "response_id": response_id}]), path, name)
+
+def _write_part(df: pd.DataFrame, path: str, name: str):
+    """Write df as path/name so readers never see a half-written file.
+
+    The data goes to a dot-prefixed temp file first (skipped by readers)
+    and is renamed into place in one step.
+    """
+    tmp = os.path.join(path, f".{name}.tmp")
+    pq.write_table(pa.Table.from_pandas(df, schema=RESPONSE_SCHEMA, preserve_index=False), tmp)
+    os.replace(tmp, os.path.join(path, name))
+
+# Revision-keyed caches only need the latest few revisions; older ones never hit again
+REV_CACHE_ENTRIES = 4
+
+# Merge a company's part files into one once there are more than this many
+COMPACT_AT = 200
+
+@st.cache_resource
+def _response_store() -> dict:
+    """Per-process {company dir: {"revs", "files", "bad", "df"}}, so reloads read only new files."""
+    return {"lock": threading.Lock(), "frames": {}}
+
+def _read_parts(path: str, names: list) -> tuple:
+    """Read part files cast to RESPONSE_SCHEMA; returns (df, names that could not be read).
+
+    Tries one dataset read first and falls back to file by file, so a single
+    unreadable file is skipped instead of failing the whole company.
+    """
+    paths = [os.path.join(path, n) for n in names]
+    bad = []
+    try:
+        tables = [pq.ParquetDataset(paths, schema=RESPONSE_SCHEMA).read()]
+    except (pa.ArrowException, OSError):
+        tables = []
+        for n, p in zip(names, paths):
+            try:
+                tables.append(pq.ParquetDataset([p], schema=RESPONSE_SCHEMA).read())
+            except (pa.ArrowException, OSError):
+                bad.append(n)
+    if not tables:
+        return RESPONSE_SCHEMA.empty_table().to_pandas(), bad
+    df = pa.concat_tables(tables).to_pandas()
+    for c in VALUE_COLUMNS:
+        # parquet hands list cells back as arrays
+        df[c] = df[c].map(list)
+    return df, bad
+
+def _load_responses(company_name: str, rev: tuple) -> pd.DataFrame:
+    """All stored responses for a company; treat the result as read-only.
+
+    Reuses the frame loaded for an earlier revision and reads only the
+    files added since, then compacts once there are COMPACT_AT files.
+    Frames for the last REV_CACHE_ENTRIES revisions are kept, so every
+    read for one rev returns the same rows even if newer files arrive.
+    """
+    if not rev[1]:
+        return pd.DataFrame()
+    path = _company_dir(company_name)
+    store = _response_store()
+    with store["lock"]:
+        cached = store["frames"].get(path)
+        if cached and rev in cached["revs"]:
+            return cached["revs"][rev]
+        names = _part_files(path)
+        if not names:
+            return pd.DataFrame()
+        if cached and cached["files"] <= set(names):
+            frames, bad = [cached["df"]], set(cached["bad"])
+            new = [n for n in names if n not in cached["files"]]
+        else:
+            # first load, or files were removed (compaction, deletion): read everything
+            frames, bad, new = [], set(), names
+        if new:
+            df_new, bad_new = _read_parts(path, new)
+            frames.append(df_new)
+            bad.update(bad_new)
+        df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        # a compaction cut short leaves the merged file and some of its parts;
+        # count each response once (older files without an id are kept as they are)
+        ids = df["response_id"]
+        df = df[ids.isna() | ~ids.duplicated()]
+        good = [n for n in names if n not in bad]
+        if len(good) > COMPACT_AT:
+            # unreadable files stay on disk as they are, outside the merge
+            names = [_compact(path, good, df)] + sorted(bad)
+        revs = cached["revs"] if cached else {}
+        revs[rev] = df
+        while len(revs) > REV_CACHE_ENTRIES:
+            revs.pop(next(iter(revs)))
+        store["frames"][path] = {"revs": revs, "files": frozenset(names), "bad": frozenset(bad), "df": df}
+        return df
+
+def unreadable_responses(company_name: str) -> list:
+    """Part files for a company that the last load had to skip."""
+    store = _response_store()
+    with store["lock"]:
+        cached = store["frames"].get(_company_dir(company_name))
+        return sorted(cached["bad"]) if cached else []
+
+def _compact(path: str, names: list, df: pd.DataFrame) -> str:
+    """Replace the part files in names with one file holding df; returns its name.
+
+    Runs under the store lock, so this process never reads both the merged
+    file and its parts. If it stops between the two steps, loads drop the
+    leftover parts' rows by response_id.
+    """
+    merged = f"{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex}.parquet"
+    _write_part(df, path, merged)
+    for n in names:
+        os.remove(os.path.join(path, n))
+    return merged
+
+def _company_frame(company_name: str, rev: tuple) -> pd.DataFrame:
+    """Return df of employee responses for a company as of rev."""
+    df = _load_responses(company_name, rev)
+    return df if df.empty else df[df["company"] == company_name]
+
+@st.cache_data(show_spinner=False, max_entries=REV_CACHE_ENTRIES)
+def department_sizes(company_name: str, rev: tuple) -> pd.Series:
+    """Responses per department, recomputed only when rev changes."""
+    df = _company_frame(company_name, rev)
+    return pd.Series(dtype="int64") if df.empty else df.groupby("department").size()
+
+def clear_employee_responses(company_name: str):
+    """Delete every stored response for a company."""
+    shutil.rmtree(_company_dir(company_name), ignore_errors=True)
+
+def clean(values) -> list:
+    """Map selected multiselect labels to value ids.
+
+    Responses store these ids; names are looked up only for display and
+    prompts (value_names). Labels missing from the map (pool changed
+    mid-session) are dropped.
+    """
+    return [OPTION_TO_ID[v] for v in values if v in OPTION_TO_ID]
+
+def value_names(values) -> list:
+    """Value names for an iterable of value ids."""
+    return [str(NAMES[i]) for i in to_idx(values)]
+
+def to_idx(values) -> np.ndarray:
+    """Pool positions for an iterable of value ids; ids no longer in the pool are dropped."""
+    ids = np.fromiter(values, dtype=np.intp)
+    pos = ID_TO_POS[ids[(ids >= 0) & (ids < len(ID_TO_POS))]]
+    return pos[pos >= 0]
 
 def calculate_entropy(values):
-    limiting = 0
-    total = 0
-    for val in values:
-        for item in MIZAN_VALUES_POOL:
-            if item["name"] == val:
-                total += 1
-                if item["type"] == "negative":
-                    limiting += 1
-    return (limiting / total) * 100 if total > 0 else 0
+    """Percent of values that are limiting, from an iterable of value ids."""
+    idx = to_idx(values)
+    return float(NEG[idx].mean() * 100) if idx.size else 0
 
 def group_values(values):
-    grouped = {i: {"positive": [], "negative": []} for i in range(1, 8)}
-    for val in values:
-        for v in MIZAN_VALUES_POOL:
-            if v["name"] == val:
-                grouped[v["level"]][v["type"]].append(val)
-    return grouped
-
-def draw_2d_mizan_dashboard(selected_values=None, mode="employee", selected_department=None):
+    """Count values per Mizan level without building per-level name lists.
+
+    Takes an iterable of value ids. Returns (counts, hovers): counts
+    is a 7x2 int array of [positive, limiting] per level 1..7; hovers maps
+    (level, type) to "name ×count" strings, most frequent first.
+    """
+    idx = to_idx(values)
+    # (level, type) packed into one int (level * 2 + is_limiting) for bincount grouping
+    codes = LEVELS[idx].astype(np.intp) * 2 + NEG[idx]
+    counts = np.bincount(codes, minlength=16).reshape(8, 2)[1:]
+    per_name = np.bincount(idx, minlength=len(NAMES))
+    hovers = {(level, vtype): [] for level in MIZAN_LEVELS for vtype in ("positive", "negative")}
+    for i in np.argsort(-per_name, kind="stable")[:np.count_nonzero(per_name)]:
+        vtype = "negative" if NEG[i] else "positive"
+        hovers[(int(LEVELS[i]), vtype)].append(f"{NAMES[i]} ×{per_name[i]}")
+    return counts, hovers
+
+def flatten(df: pd.DataFrame, *cols) -> list:
+    """Chain the list cells of cols into one flat list, skipping non-list cells.
+
+    Callers pass response frames, which always carry VALUE_COLUMNS.
+    """
+    return list(chain.from_iterable(x for c in cols for x in df[c] if isinstance(x, list)))
+
+def tally(df: pd.DataFrame, cols=("current_experience", "desired_values")) -> tuple:
+    """Return (entropy %, counts, hovers) for the values in cols."""
+    values = flatten(df, *cols)
+    return (calculate_entropy(values), *group_values(values))
+
+# employee picks rarely repeat, so keep only the last few figures
+@st.cache_data(show_spinner=False, max_entries=8)
+def build_mizan_fig(counts: tuple, hovers: tuple, title: str) -> go.Figure:
+    """Dashboard figure from per-level (positive, limiting) counts and hover strings."""
+    level_names = list(MIZAN_LEVELS.values())
+    fig = go.Figure([
+        go.Bar(
+            x=[pos for pos, _ in counts], y=level_names, orientation="h",
+            name="Positive", marker_color="green",
+            hovertext=[pos for pos, _ in hovers],
+        ),
+        go.Bar(
+            x=[-neg for _, neg in counts], y=level_names, orientation="h",
+            name="Limiting", marker_color="red",
+            hovertext=[neg for _, neg in hovers],
+        ),
+    ])
+    fig.update_layout(
+        barmode="relative",
+        height=500,
+        title=title,
+        xaxis_title="Count",
+        yaxis_title="Levels",
+    )
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=REV_CACHE_ENTRIES)
+def _admin_chart_data(company_name: str, rev: tuple, department=None):
+    """(counts, hovers) tuples for a company's dashboard, or None without data.
+
+    Keyed on the responses revision, so reruns that add no response skip
+    the aggregation entirely.
+    """
+    df = _company_frame(company_name, rev)
+    if df.empty:
+        return None
+    if department:
+        df = df[df["department"] == department]
+        if df.empty:
+            return None
+    _, counts, hovers = tally(df)
+    return _chart_args(counts, hovers)
+
+def _chart_args(counts, hovers) -> tuple:
+    """group_values output as the hashable tuples build_mizan_fig takes."""
+    return (
+        tuple(map(tuple, counts.tolist())),
+        tuple(("<br>".join(hovers[(l, "positive")]), "<br>".join(hovers[(l, "negative")])) for l in MIZAN_LEVELS),
+    )
+
+def draw_2d_mizan_dashboard(selected_values=None, mode="employee", selected_department=None, rev=None):
     st.subheader("Mizan Value Distribution")
 
     if mode == "employee":
@@ -80,60 +448,58 @@ def draw_2d_mizan_dashboard(selected_values=None, mode="employee", selected_depa
         if not data:
             st.info("No values selected yet.")
             return
+        chart = _chart_args(*group_values(data))
     else:
-        entries = [e for e in st.session_state.get("employee_responses", []) if isinstance(e, dict)]
-        if not entries:
+        company_name = get_company().get("name", "")
+        if rev is None:
+            rev = _responses_rev(company_name)
+        if not rev[1]:
             st.info("No employee data available yet.")
             return
-        df = pd.DataFrame(entries)
-        if selected_department and "department" in df.columns:
-            df = df[df["department"] == selected_department]
-        if df.empty:
+        chart = _admin_chart_data(company_name, rev, selected_department)
+        if chart is None:
             st.info("No data for the selected filter.")
             return
-        data = (
-            df.get("current_experience", pd.Series(dtype=object)).explode().dropna().tolist()
-            + df.get("desired_values", pd.Series(dtype=object)).explode().dropna().tolist()
-        )
 
-    grouped = group_values(data)
-    fig = go.Figure()
-    for level, level_name in MIZAN_LEVELS.items():
-        pos = len(grouped[level]["positive"])
-        neg = len(grouped[level]["negative"])
-        fig.add_trace(
-            go.Bar(
-                x=[pos], y=[level_name], orientation="h",
-                name="Positive", marker_color="green",
-                hovertext=grouped[level]["positive"]
-            )
-        )
-        fig.add_trace(
-            go.Bar(
-                x=[-neg], y=[level_name], orientation="h",
-                name="Limiting", marker_color="red",
-                hovertext=grouped[level]["negative"]
-            )
-        )
-    fig.update_layout(
-        barmode="relative",
-        height=500,
-        title=f"Mizan Dashboard – {selected_department or 'You'}",
-        xaxis_title="Count",
-        yaxis_title="Levels",
+    fig = build_mizan_fig(*chart, f"Mizan Dashboard – {selected_department or 'You'}")
+    # stable key: reruns update the existing chart instead of re-creating it
+    st.plotly_chart(fig, use_container_width=True, key=f"mizan_{mode}_{selected_department}")
+
+def values_by_department(df: pd.DataFrame) -> dict:
+    """Return {department: {column: [values]}} for VALUE_COLUMNS.
+
+    One melt + explode + groupby over the whole frame instead of three
+    explodes per department.
+    """
+    long = (
+        df[["department", *VALUE_COLUMNS]]
+        .melt("department", var_name="kind", value_name="val")
+        .explode("val")
+        .dropna(subset=["val"])
     )
-    st.plotly_chart(fig, use_container_width=True)
-
-def run_dept_insight(dept_df: pd.DataFrame, dept: str) -> str:
-    current = dept_df.get("current_experience", pd.Series(dtype=object)).explode().dropna().tolist()
-    desired = dept_df.get("desired_values", pd.Series(dtype=object)).explode().dropna().tolist()
-    dept_prompt = f"""
+    by_dept = {dept: {c: [] for c in VALUE_COLUMNS} for dept in df["department"].dropna().unique()}
+    for (dept, kind), vals in long.groupby(["department", "kind"])["val"]:
+        by_dept[dept][kind] = vals.tolist()
+    return by_dept
+
+def summarize_values(values) -> str:
+    """Value ids as "value×count" pairs, most frequent first.
+
+    Bounded by the pool size rather than headcount, so prompts stay short.
+    """
+    counts = Counter(value_names(values))
+    pairs = ", ".join(f"{v}×{c}" for v, c in counts.most_common())
+    return f"{pairs} ({sum(counts.values())} picks, {len(counts)} distinct)"
+
+def build_dept_prompt(dept: str, n_responses: int, values: dict) -> str:
+    return f"""
 You are an AI trained on Mizan's 7-level framework (levels, value definitions, and ethics links).
 
 Department: {dept}
-Responses: {len(dept_df)}
-Current values: {current}
-Desired values: {desired}
+Responses: {n_responses}
+Current values: {summarize_values(values["current_experience"])}
+Desired values: {summarize_values(values["desired_values"])}
+Personal values: {summarize_values(values["personal_values"])}
 
 Please:
 - Count & categorize values by Mizan levels
@@ -142,25 +508,26 @@ Please:
 - Offer 3–6 crisp actions to reduce entropy and move toward the desired values
 - Keep tone warm, supportive, and practical
 """
-    with st.spinner(f"Analyzing {dept}..."):
-        resp = client.chat.completions.create(
-            model="gpt-4",
-            messages=[{"role": "user", "content": dept_prompt}],
-        )
-    text = resp.choices[0].message.content.strip()
+
+def run_dept_insight(dept: str, n_responses: int, values: dict) -> str:
+    """Stream the department insight onto the page and return its text."""
+    dept_prompt = build_dept_prompt(dept, n_responses, values)
+    text = stream_chat(dept_prompt, max_tokens=DEPT_MAX_TOKENS)
     log_ai_insight(text, context=f"dept_{dept}_analysis")
     return text
 
-def run_org_insight(df: pd.DataFrame, company_name: str) -> str:
-    all_current = df.get("current_experience", pd.Series(dtype=object)).explode().dropna().tolist()
-    all_desired = df.get("desired_values", pd.Series(dtype=object)).explode().dropna().tolist()
-    org_prompt = f"""
+def build_org_prompt(df: pd.DataFrame, company_name: str) -> str:
+    all_current = flatten(df, "current_experience")
+    all_desired = flatten(df, "desired_values")
+    all_personal = flatten(df, "personal_values")
+    return f"""
 You are an AI trained on Mizan's 7-level framework (levels, value definitions, ethics links).
 
 Company: {company_name}
 Total responses: {len(df)}
-Current (all): {all_current}
-Desired (all): {all_desired}
+Current (all): {summarize_values(all_current)}
+Desired (all): {summarize_values(all_desired)}
+Personal (all): {summarize_values(all_personal)}
 
 Please provide an org-level summary:
 - Overall level distribution (current vs desired)
@@ -170,26 +537,352 @@ Please provide an org-level summary:
 - 5–8 actionable recommendations (quick wins → structural moves)
 Use clear, warm, supportive language and bullet points.
 """
-    with st.spinner("Analyzing organization..."):
-        resp = client.chat.completions.create(
-            model="gpt-4",
-            messages=[{"role": "user", "content": org_prompt}],
+
+def run_org_insight(df: pd.DataFrame, company_name: str) -> str:
+    """Stream the org insight onto the page and return its text."""
+    org_prompt = build_org_prompt(df, company_name)
+    text = stream_chat(org_prompt, model=ORG_MODEL, max_tokens=ORG_MAX_TOKENS)
+    log_ai_insight(text, context="org_culture_analysis")
+    return text
+
+def build_org_design_prompt(company: dict, df_struct: pd.DataFrame) -> str:
+    preview = df_struct.head(20).to_csv(index=False)
+    return f"""
+You are an expert in organizational design. Given:
+Company: {company.get('name','')}
+Vision: {company.get('vision','')}
+Mission: {company.get('mission','')}
+Strategy: {company.get('strategy','')}
+Values: {company.get('values','')}
+
+Here is a preview of the company structure:
+{preview}
+
+Please:
+- Assess alignment of structure with vision/strategy
+- Identify structure type
+- Recommend design improvements
+- Include practical organizational design suggestions (clarity, span of control, role alignment, agility).
+"""
+
+async def _achat(
+    aclient: AsyncOpenAI, prompt: str, model: str, max_tokens: int, sem: asyncio.Semaphore
+) -> str:
+    cache = _llm_cache()
+    key = _llm_cache_key(model, max_tokens, prompt)
+    hit = cache.get(key)
+    if hit is not None:
+        return hit
+    async with sem:
+        resp = await aclient.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=TEMPERATURE,
         )
     text = resp.choices[0].message.content.strip()
-    log_ai_insight(text, context="org_culture_analysis")
+    cache.set(key, text, expire=LLM_CACHE_TTL)
     return text
 
+async def _gather_chats(requests: list) -> list:
+    """Run (prompt, model, max_tokens) requests concurrently; results keep input order."""
+    # Fresh async client per fan-out: its connection pool is bound to the
+    # event loop, and each asyncio.run() below starts a new one.
+    async with AsyncOpenAI(api_key=OPENAI_API_KEY, max_retries=FANOUT_MAX_RETRIES) as aclient:
+        sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        return await asyncio.gather(*[_achat(aclient, p, m, n, sem) for p, m, n in requests])
+
+def _insight_jobs(df: pd.DataFrame, company: dict, df_struct=None) -> list:
+    """(title, log context, prompt, model, max_tokens) for each department and the org.
+
+    Adds the org-design job when a structure frame is given.
+    """
+    company_name = company.get("name", "")
+    sizes = df.groupby("department").size()
+    by_dept = values_by_department(df)
+    jobs = [
+        (dept, f"dept_{dept}_analysis", build_dept_prompt(dept, sizes[dept], by_dept[dept]), MODEL, DEPT_MAX_TOKENS)
+        for dept in sorted(by_dept)
+    ]
+    jobs.append((
+        "Organization", "org_culture_analysis", build_org_prompt(df, company_name), ORG_MODEL, ORG_MAX_TOKENS,
+    ))
+    if df_struct is not None:
+        jobs.append((
+            "Organizational Design", "org_design_analysis", build_org_design_prompt(company, df_struct), MODEL, MAX_TOKENS,
+        ))
+    return jobs
+
+def run_all_insights(df: pd.DataFrame, company: dict, df_struct=None) -> list:
+    """Run every department insight plus the org (and org-design) insight concurrently.
+
+    Returns (title, text) pairs in display order.
+    """
+    jobs = _insight_jobs(df, company, df_struct)
+    with st.spinner(f"Running {len(jobs)} analyses..."):
+        texts = asyncio.run(_gather_chats([(prompt, model, n) for _, _, prompt, model, n in jobs]))
+    results = []
+    for (title, context, *_), text in zip(jobs, texts):
+        log_ai_insight(text, context=context)
+        results.append((title, text))
+    return results
+
+def queue_batch_insights(df: pd.DataFrame, company: dict, df_struct=None) -> tuple:
+    """Submit the same insight jobs to the OpenAI Batch API (cheaper, up to 24h).
+
+    Returns (batch id, {custom_id: {"title", "cache_key"}}).
+    """
+    client = get_openai_client()
+    jobs = _insight_jobs(df, company, df_struct)
+    lines = [
+        json.dumps({
+            "custom_id": context,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": model,
+                "messages": [{"role": "user", "content": prompt}],
+                "max_tokens": max_tokens,
+                "temperature": TEMPERATURE,
+            },
+        })
+        for _, context, prompt, model, max_tokens in jobs
+    ]
+    batch_file = client.files.create(
+        file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    return batch.id, {
+        context: {"title": title, "cache_key": _llm_cache_key(model, max_tokens, prompt)}
+        for title, context, prompt, model, max_tokens in jobs
+    }
+
+def fetch_batch_insights(batch_id: str, jobs: dict) -> tuple:
+    """Return (status, [(title, text)]); results are empty until the batch completes.
+
+    Completed texts also go into the response cache, so the live buttons
+    reuse them for identical prompts.
+    """
+    client = get_openai_client()
+    batch = client.batches.retrieve(batch_id)
+    if batch.status != "completed" or not batch.output_file_id:
+        return batch.status, []
+    cache = _llm_cache()
+    results = []
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        choices = ((record.get("response") or {}).get("body") or {}).get("choices") or []
+        if not choices:
+            continue
+        text = choices[0]["message"]["content"].strip()
+        job = jobs.get(record["custom_id"])
+        if job:
+            cache.set(job["cache_key"], text, expire=LLM_CACHE_TTL)
+        log_ai_insight(text, context=f"batch_{record['custom_id']}")
+        results.append((job["title"] if job else record["custom_id"], text))
+    order = [job["title"] for job in jobs.values()]
+    results.sort(key=lambda r: order.index(r[0]) if r[0] in order else len(order))
+    return batch.status, results
+
+# -------------------------------
+# Page Fragments
+# -------------------------------
+@st.fragment
+def culture_analysis(ci: dict):
+    """Post-assessment section; its widgets rerun only this fragment."""
+    # one revision per run, so the frame, department list and dashboard agree
+    rev = _responses_rev(ci["name"])
+    df_emp = _company_frame(ci["name"], rev)
+    st.header("4. Organizational Culture Analysis")
+    bad = unreadable_responses(ci["name"])
+    if bad:
+        st.warning(f"Skipped {len(bad)} stored response file(s) that could not be read: {', '.join(bad)}")
+
+    if df_emp.empty:
+        st.info("No employee submissions yet.")
+    else:
+        # Departmental Results
+        st.subheader("Departmental Results")
+        dept_sizes = department_sizes(ci["name"], rev)
+        depts = dept_sizes.index.tolist()
+        if depts:
+            sel_dept = st.selectbox("Choose department", depts, key="dept_select")
+            if st.button(" Generate Department Result", key="btn_dept"):
+                vals = values_by_department(df_emp)[sel_dept]
+                dept_entropy = calculate_entropy(chain(vals["current_experience"], vals["desired_values"]))
+                st.caption(f"Entropy for {sel_dept}: **{dept_entropy:.1f}%**")
+                run_dept_insight(sel_dept, dept_sizes[sel_dept], vals)
+        else:
+            st.warning("No department data available.")
+
+        # Org Result
+        st.subheader("Organization-wide Result")
+        if st.button(" Generate Org Result", key="btn_org"):
+            org_entropy, _, _ = tally(df_emp)
+            st.caption(f"Entropy for {ci['name']}: **{org_entropy:.1f}%**")
+            run_org_insight(df_emp, ci["name"])
+
+        # All departments + org in one go
+        st.subheader("All Departments & Organization")
+        if st.button(" Generate All Results", key="btn_all"):
+            for title, text in run_all_insights(df_emp, ci, st.session_state.get("company_structure")):
+                st.markdown(f"#### {title}")
+                st.markdown(text)
+
+        # Same reports via the Batch API: ~half the cost, results within 24h
+        st.subheader("Overnight Batch Analysis")
+        if st.button(" Queue Batch Analysis", key="btn_batch_queue"):
+            batch_id, jobs = queue_batch_insights(df_emp, ci, st.session_state.get("company_structure"))
+            st.session_state["_batch"] = {"id": batch_id, "jobs": jobs}
+            st.session_state.pop("_batch_results", None)
+        batch = st.session_state.get("_batch")
+        if batch:
+            st.caption(f"Batch job: `{batch['id']}`")
+            if st.button(" Check Batch Results", key="btn_batch_poll"):
+                status, results = fetch_batch_insights(batch["id"], batch["jobs"])
+                if results:
+                    st.session_state["_batch_results"] = results
+                else:
+                    st.info(f"Batch status: {status}")
+            for title, text in st.session_state.get("_batch_results", []):
+                st.markdown(f"#### {title}")
+                st.markdown(text)
+
+        # Visual dashboard (all data)
+        st.subheader("Mizan Dashboard")
+        draw_2d_mizan_dashboard(mode="admin", rev=rev)
+
+    # Stored responses are shared by every session, so deleting them needs explicit confirmation.
+    # Shown whenever files exist, even if none could be read.
+    if rev[1]:
+        with st.expander("Delete stored responses"):
+            st.caption(f"Permanently deletes all {rev[1]} stored response files for {ci['name']}, for every user.")
+            confirm = st.checkbox("I understand this cannot be undone", key="confirm_delete_responses")
+            if st.button("Delete stored responses", key="btn_delete_responses", disabled=not confirm):
+                clear_employee_responses(ci["name"])
+                st.rerun()
+
+@st.fragment
+def employee_page():
+    """Employee assessment page; its widgets rerun only this fragment."""
+    st.image(_logo(), width=100)
+    st.markdown("<h1 style='color:#284B63;'>Mizan Culture Intelligence Platform</h1>", unsafe_allow_html=True)
+    st.markdown("<hr style='border:1px solid #ccc;'>", unsafe_allow_html=True)
+
+    if "company_info" not in st.session_state or "company_structure" not in st.session_state:
+        st.warning("The company has not completed setup.")
+    else:
+        # blank cells would otherwise offer "nan"; codes are stored as text
+        dept_list = st.session_state["company_structure"]["Employee Department"].dropna().astype(str).unique()
+
+        # Steps 1-5 live in a form so inputs don't rerun the page until submit
+        with st.form("assessment"):
+            st.markdown("### Step 1: Your Information")
+            emp_name = st.text_input("Your Name")
+            emp_email = st.text_input("Your Email")
+            emp_dept = st.selectbox("Your Department", dept_list)
+
+            st.markdown("### Step 2: Your Values")
+            personal = st.multiselect("Your Personal Values (select 7)", VALUE_OPTIONS)
+
+            st.markdown("### Step 3: Current Culture")
+            current = st.multiselect("Current Company Values (select 7)", VALUE_OPTIONS)
+
+            st.markdown("### Step 4: Desired Culture")
+            desired = st.multiselect("Desired Future Values (select 7)", VALUE_OPTIONS)
+
+            st.markdown("### Step 5: Experience Ratings")
+            engagement = st.slider("How engaged do you feel at work?", 1, 5)
+            recognition = st.slider("How often are you recognized?", 1, 5)
+
+            submitted = st.form_submit_button("Generate My Report")
+
+        if submitted:
+            if not emp_dept:
+                st.warning("Please choose your department.")
+                return
+            picks = {}
+            for label, picked in (("Personal", personal), ("Current", current), ("Desired", desired)):
+                if len(picked) != 7:
+                    st.warning(f"Please select exactly 7 values for {label}.")
+                    return
+                # checked after clean(): labels from an older pool don't resolve
+                picks[label] = clean(picked)
+                if len(picks[label]) != 7:
+                    st.warning(f"Some {label} values are no longer available. Please select them again.")
+                    return
+
+            entry = {
+                "name": emp_name,
+                "email": emp_email,
+                "department": str(emp_dept),
+                "personal_values": picks["Personal"],
+                "current_experience": picks["Current"],
+                "desired_values": picks["Desired"],
+                "engagement": engagement,
+                "recognition": recognition,
+                "company": get_company().get("name", ""),
+            }
+
+            prompt = f"""
+You are an AI trained on Mizan's 7-level values framework (levels, value definitions, ethics links).
+
+Personal: {value_names(entry['personal_values'])}
+Current: {value_names(entry['current_experience'])}
+Desired: {value_names(entry['desired_values'])}
+Engagement: {entry['engagement']}
+Recognition: {entry['recognition']}
+
+Company: {entry['company']}
+Please provide:
+- Level distribution and alignment across the 3 sets of values
+- Cultural entropy (gap between current and desired values)
+- Alignment between employee values and mission/vision/strategy
+- Opportunities for growth and development
+Keep the tone supportive, insightful, and actionable.
+"""
+            st.markdown("### Your Personalized Report")
+            report = stream_chat(prompt)
+            log_ai_insight(report, context=f"employee_{emp_email}_report")
+
+            # Entropy display
+            entropy = calculate_entropy(chain(entry["current_experience"], entry["desired_values"]))
+            st.markdown(f"### Cultural Entropy Score: `{entropy:.1f}%`")
+            if entropy < 10:
+                st.success("🟢 Low cultural entropy. Strong alignment.")
+            elif entropy < 20:
+                st.warning("🟠 Moderate cultural entropy. Some limiting values detected.")
+            else:
+                st.error("🔴 High cultural entropy. Cultural friction likely.")
+
+            # Persist
+            add_employee_response(entry)
+
+            # Visual dashboard
+            st.subheader("Your Visual Dashboard")
+            draw_2d_mizan_dashboard(
+                selected_values=entry["personal_values"] + entry["current_experience"] + entry["desired_values"],
+                mode="employee",
+            )
+
 # -------------------------------
 # Sidebar & Navigation
 # -------------------------------
-st.sidebar.image("logo.png", width=150)
+st.sidebar.image(_logo(), width=150)
 page = st.sidebar.radio("Navigation", ["Company", "Employee"])
 
 # -------------------------------
 # Company Page
 # -------------------------------
 if page == "Company":
-    st.image("logo.png", width=100)
+    st.image(_logo(), width=100)
     st.markdown("<h1 style='color:#284B63;'>Mizan Culture Intelligence Platform</h1>", unsafe_allow_html=True)
     st.markdown("<hr style='border:1px solid #ccc;'>", unsafe_allow_html=True)
 
@@ -230,86 +923,44 @@ if page == "Company":
         st.header("2. Upload Company Structure")
         file = st.file_uploader("Upload Structure CSV", type="csv")
         if file:
-            df_struct = pd.read_csv(file)
-            needed = ["Employee Name", "Employee Email", "Employee Department", "Supervisor Name"]
-            if all(col in df_struct.columns for col in needed):
-                st.session_state["company_structure"] = df_struct
+            # Parse only when the uploaded bytes change, not on every rerun
+            data = file.getvalue()
+            struct_hash = hashlib.md5(data).hexdigest()
+            if st.session_state.get("_struct_hash") != struct_hash:
+                df_struct = _parse_structure(data)
+                needed = ["Employee Name", "Employee Email", "Employee Department", "Supervisor Name"]
+                struct_ok = all(col in df_struct.columns for col in needed)
+                if struct_ok:
+                    st.session_state["company_structure"] = df_struct
+                st.session_state["_struct_hash"] = struct_hash
+                st.session_state["_struct_ok"] = struct_ok
+                st.session_state.pop("_org_insight", None)
+            if st.session_state["_struct_ok"]:
+                df_struct = st.session_state["company_structure"]
                 st.dataframe(df_struct)
                 st.success("Structure uploaded.")
 
                 # On-demand org-design insight
                 if st.button(" Generate Org-Design Insight"):
-                    preview = df_struct.head(20).to_csv(index=False)
-                    prompt = f"""
-You are an expert in organizational design. Given:
-Company: {ci.get('name','')}
-Vision: {ci.get('vision','')}
-Mission: {ci.get('mission','')}
-Strategy: {ci.get('strategy','')}
-Values: {ci.get('values','')}
-
-Here is a preview of the company structure:
-{preview}
-
-Please:
-- Assess alignment of structure with vision/strategy
-- Identify structure type
-- Recommend design improvements
-- Include practical organizational design suggestions (clarity, span of control, role alignment, agility).
-"""
-                    with st.spinner("Generating insights..."):
-                        response = client.chat.completions.create(
-                            model="gpt-4",
-                            messages=[{"role": "user", "content": prompt}],
-                        )
-                    org_insight = response.choices[0].message.content.strip()
-                    st.markdown(org_insight)
+                    org_insight = stream_chat(build_org_design_prompt(ci, df_struct))
+                    st.session_state["_org_insight"] = org_insight
                     log_ai_insight(org_insight, context="org_design_analysis")
+                elif st.session_state.get("_org_insight"):
+                    st.markdown(st.session_state["_org_insight"])
             else:
                 st.error("Missing required columns in CSV.")
 
     # Post-Assessment (button-driven)
     if ci.get("name"):
-        df_emp = get_employee_df_for_company(ci["name"])
-        st.header("4. Organizational Culture Analysis")
-
-        if df_emp.empty:
-            st.info("No employee submissions yet.")
-        else:
-            # Departmental Results
-            st.subheader("Departmental Results")
-            depts = sorted(
-                df_emp.get("department", pd.Series(dtype=object))
-                .dropna()
-                .unique()
-                .tolist()
-            )
-            if depts:
-                sel_dept = st.selectbox("Choose department", depts, key="dept_select")
-                if st.button(" Generate Department Result", key="btn_dept"):
-                    dept_df = df_emp[df_emp["department"] == sel_dept]
-                    cur = dept_df.get("current_experience", pd.Series(dtype=object)).explode().dropna().tolist()
-                    des = dept_df.get("desired_values", pd.Series(dtype=object)).explode().dropna().tolist()
-                    dept_entropy = calculate_entropy(cur + des)
-                    st.caption(f"Entropy for {sel_dept}: **{dept_entropy:.1f}%**")
-                    dept_text = run_dept_insight(dept_df, sel_dept)
-                    st.markdown(dept_text)
-            else:
-                st.warning("No department data available.")
-
-            # Org Result
-            st.subheader("Organization-wide Result")
-            if st.button(" Generate Org Result", key="btn_org"):
-                org_text = run_org_insight(df_emp, ci["name"])
-                st.markdown(org_text)
-
-            # Visual dashboard (all data)
-            st.subheader("Mizan Dashboard")
-            draw_2d_mizan_dashboard(mode="admin")
+        culture_analysis(ci)
 
 st.markdown("---")
 if st.button("🔄 Reset Demo Data"):
-    for key in ["company_info", "company_structure", "employee_responses"]:
+    # session only; stored responses are deleted from the culture analysis section
+    for key in [
+        "company_info", "company_structure",
+        "_struct_hash", "_struct_ok", "_org_insight", "_batch", "_batch_results",
+    ]:
         if key in st.session_state:
             del st.session_state[key]
     st.success("Demo data has been reset. Ready for a fresh run!")
@@ -318,106 +969,4 @@ if st.button("🔄 Reset Demo Data"):
 # Employee Page
 # -------------------------------
 elif page == "Employee":
-    st.image("logo.png", width=100)
-    st.markdown("<h1 style='color:#284B63;'>Mizan Culture Intelligence Platform</h1>", unsafe_allow_html=True)
-    st.markdown("<hr style='border:1px solid #ccc;'>", unsafe_allow_html=True)
-
-    if "company_info" not in st.session_state or "company_structure" not in st.session_state:
-        st.warning("The company has not completed setup.")
-    else:
-        st.markdown("### Step 1: Your Information")
-        emp_name = st.text_input("Your Name")
-        emp_email = st.text_input("Your Email")
-        dept_list = st.session_state["company_structure"]["Employee Department"].unique()
-        emp_dept = st.selectbox("Your Department", dept_list)
-
-        def get_options():
-            return [f"{v['name']}: {v['definition']}" for v in MIZAN_VALUES_POOL]
-
-        def clean(vs):
-            return [v.split(":")[0].strip() for v in vs]
-
-        st.markdown("### Step 2: Your Values")
-        personal = st.multiselect("Your Personal Values (select 7)", get_options())
-        if len(personal) != 7:
-            st.info("Please select exactly 7 values for Personal.")
-            st.stop()
-
-        st.markdown("### Step 3: Current Culture")
-        current = st.multiselect("Current Company Values (select 7)", get_options())
-        if len(current) != 7:
-            st.info("Please select exactly 7 values for Current.")
-            st.stop()
-
-        st.markdown("### Step 4: Desired Culture")
-        desired = st.multiselect("Desired Future Values (select 7)", get_options())
-        if len(desired) != 7:
-            st.info("Please select exactly 7 values for Desired.")
-            st.stop()
-
-        st.markdown("### Step 5: Experience Ratings")
-        engagement = st.slider("How engaged do you feel at work?", 1, 5)
-        recognition = st.slider("How often are you recognized?", 1, 5)
-
-        if st.button("Generate My Report"):
-            entry = {
-                "name": emp_name,
-                "email": emp_email,
-                "department": emp_dept,
-                "personal_values": clean(personal),
-                "current_experience": clean(current),
-                "desired_values": clean(desired),
-                "engagement": engagement,
-                "recognition": recognition,
-                "company": get_company().get("name", ""),
-            }
-
-            prompt = f"""
-You are an AI trained on Mizan's 7-level values framework (levels, value definitions, ethics links).
-
-Personal: {entry['personal_values']}
-Current: {entry['current_experience']}
-Desired: {entry['desired_values']}
-Engagement: {entry['engagement']}
-Recognition: {entry['recognition']}
-
-Company: {entry['company']}
-Please provide:
-- Level distribution and alignment across the 3 sets of values
-- Cultural entropy (gap between current and desired values)
-- Alignment between employee values and mission/vision/strategy
-- Opportunities for growth and development
-Keep the tone supportive, insightful, and actionable.
-"""
-            with st.spinner("Analyzing your results..."):
-                response = client.chat.completions.create(
-                    model="gpt-4",
-                    messages=[{"role": "user", "content": prompt}],
-                )
-                report = response.choices[0].message.content.strip()
-
-            st.markdown("### Your Personalized Report")
-            st.write(report)
-            log_ai_insight(report, context=f"employee_{emp_email}_report")
-
-            # Entropy display
-            entropy = calculate_entropy(entry["current_experience"] + entry["desired_values"])
-            st.markdown(f"### Cultural Entropy Score: `{entropy:.1f}%`")
-            if entropy < 10:
-                st.success("🟢 Low cultural entropy. Strong alignment.")
-            elif entropy < 20:
-                st.warning("🟠 Moderate cultural entropy. Some limiting values detected.")
-            else:
-                st.error("🔴 High cultural entropy. Cultural friction likely.")
-
-            # Persist
-            if "employee_responses" not in st.session_state:
-                st.session_state["employee_responses"] = []
-            st.session_state["employee_responses"].append(entry)
-
-            # Visual dashboard
-            st.subheader("Your Visual Dashboard")
-            draw_2d_mizan_dashboard(
-                selected_values=entry["personal_values"] + entry["current_experience"] + entry["desired_values"],
-                mode="employee",
-            )
\ No newline at end of file
+    employee_page()